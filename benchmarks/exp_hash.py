@@ -72,8 +72,12 @@ def _get_hasher(hash_algorithm: str) -> hashing.StreamingHashEngine:
     # TODO: Once Python 3.9 support is deprecated revert to using `match`
     if hash_algorithm == "sha256":
         return memory.SHA256()
+    if hash_algorithm == "sha256_evp":
+        return memory.SHA256EVP()
     if hash_algorithm == "blake2":
         return memory.BLAKE2()
+    if hash_algorithm == "blake3":
+        return memory.BLAKE3()
 
     raise ValueError(f"Cannot convert {hash_algorithm} to a hash engine")
 
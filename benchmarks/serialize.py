@@ -16,6 +16,8 @@
 
 import argparse
 from collections.abc import Callable
+import functools
+import hashlib
 import pathlib
 from typing import Optional
 
@@ -44,14 +46,62 @@ def get_hash_engine_factory(
     # TODO: Once Python 3.9 support is deprecated revert to using `match`
     if hash_algorithm == "sha256":
         return memory.SHA256
+    if hash_algorithm == "sha256_evp":
+        return memory.SHA256EVP
     if hash_algorithm == "blake2":
         return memory.BLAKE2
+    if hash_algorithm == "blake3":
+        return memory.BLAKE3
 
     raise ValueError(f"Cannot convert {hash_algorithm} to a hash engine")
 
 
+def _build_sharded_file_hasher(
+    sharded_hasher: type[file.ShardedFileHasher],
+    hash_engine: type[hashing.StreamingHashEngine],
+    chunk_size: int,
+    shard_size: int,
+    path: pathlib.Path,
+    start: int,
+    end: int,
+) -> file.ShardedFileHasher:
+    """Builds a sharded file hasher. Module level so factories can pickle."""
+    return sharded_hasher(
+        path,
+        hash_engine(),  # pytype: disable=not-instantiable
+        start=start,
+        end=end,
+        chunk_size=chunk_size,
+        shard_size=shard_size,
+    )
+
+
+def _build_file_hasher(
+    file_hasher: type[file.SimpleFileHasher],
+    hash_engine: type[hashing.StreamingHashEngine],
+    chunk_size: int,
+    path: pathlib.Path,
+) -> file.FileHasher:
+    """Builds a file hasher. Module level so factories can pickle."""
+    return file_hasher(
+        path,
+        hash_engine(),  # pytype: disable=not-instantiable
+        chunk_size=chunk_size,
+    )
+
+
+def _build_file_digest_hasher(
+    algorithm: str, path: pathlib.Path
+) -> file.FileHasher:
+    """Builds a file_digest hasher. Module level so factories can pickle."""
+    return file.FileDigestHasher(path, algorithm=algorithm)
+
+
 def get_sharded_file_hasher_factory(
-    hash_algorithm: str, chunk_size: int, shard_size: int
+    hash_algorithm: str,
+    chunk_size: int,
+    shard_size: int,
+    use_mmap: bool = False,
 ) -> Callable[[pathlib.Path, int, int], file.ShardedFileHasher]:
     """Returns a hasher factory for sharded serialization.
 
@@ -59,49 +109,66 @@ def get_sharded_file_hasher_factory(
         hash_algorithm: the hash algorithm to use for each shard.
         chunk_size: the chunk size to use when reading shards.
         shard_size: the shard size used in generating the shards.
+        use_mmap: whether to hash via a memory-mapped view of the shards.
 
     Returns:
         A callable for the hashing factory.
     """
     hash_engine = get_hash_engine_factory(hash_algorithm)
-
-    def _hasher_factory(
-        path: pathlib.Path, start: int, end: int
-    ) -> file.ShardedFileHasher:
-        return file.ShardedFileHasher(
-            path,
-            hash_engine(),  # pytype: disable=not-instantiable
-            start=start,
-            end=end,
-            chunk_size=chunk_size,
-            shard_size=shard_size,
-        )
-
-    return _hasher_factory
+    sharded_hasher = (
+        file.MmapShardedFileHasher if use_mmap else file.ShardedFileHasher
+    )
+    return functools.partial(
+        _build_sharded_file_hasher,
+        sharded_hasher,
+        hash_engine,
+        chunk_size,
+        shard_size,
+    )
 
 
 def get_file_hasher_factory(
-    hash_algorithm: str, chunk_size: int
+    hash_algorithm: str,
+    chunk_size: int,
+    use_mmap: bool = False,
+    use_file_digest: bool = False,
 ) -> Callable[[pathlib.Path], file.FileHasher]:
     """Returns a hasher factory for file serialization.
 
     Args:
         hash_algorithm: the hash algorithm to use for each file.
         chunk_size: the chunk size to use when reading files.
+        use_mmap: whether to hash via a memory-mapped view of the files.
+        use_file_digest: whether to hash via `hashlib.file_digest`, which
+          runs the whole read/update loop in C. Takes precedence over
+          `use_mmap`, and ignores the chunk size.
 
     Returns:
         A callable for the hashing factory.
+
+    Raises:
+        ValueError: if `use_file_digest` is set but the algorithm is not
+          provided by `hashlib` (e.g., blake3).
     """
     hash_engine = get_hash_engine_factory(hash_algorithm)
 
-    def _hasher_factory(path: pathlib.Path) -> file.FileHasher:
-        return file.SimpleFileHasher(
-            path,
-            hash_engine(),  # pytype: disable=not-instantiable
-            chunk_size=chunk_size,
-        )
-
-    return _hasher_factory
+    if use_file_digest:
+        # The engines are named after their `hashlib` algorithm, so the
+        # digest name can be reused to reconstruct the algorithm.
+        algorithm = (
+            hash_engine().digest_name
+        )  # pytype: disable=not-instantiable
+        if algorithm not in hashlib.algorithms_available:
+            raise ValueError(
+                f"Cannot use {hash_algorithm} with file_digest, it is not a"
+                " hashlib algorithm"
+            )
+        return functools.partial(_build_file_digest_hasher, algorithm)
+
+    file_hasher = file.MmapFileHasher if use_mmap else file.SimpleFileHasher
+    return functools.partial(
+        _build_file_hasher, file_hasher, hash_engine, chunk_size
+    )
 
 
 def run(args: argparse.Namespace) -> Optional[in_toto.IntotoPayload]:
@@ -113,12 +180,19 @@ def run(args: argparse.Namespace) -> Optional[in_toto.IntotoPayload]:
     # 1. Hashing layer
     if args.use_shards:
         hasher = get_sharded_file_hasher_factory(
-            args.hash_method, args.chunk, args.shard
+            args.hash_method, args.chunk, args.shard, args.use_mmap
         )
     else:
-        hasher = get_file_hasher_factory(args.hash_method, args.chunk)
+        hasher = get_file_hasher_factory(
+            args.hash_method, args.chunk, args.use_mmap, args.use_file_digest
+        )
 
     # 2. Serialization layer
+    # Only the file level serializers support hashing in separate processes.
+    serializer_kwargs = {}
+    if not args.use_shards:
+        serializer_kwargs["use_processes"] = args.use_processes
+
     if args.skip_manifest or args.single_digest:
         merge_hasher_factory = get_hash_engine_factory(args.merge_hasher)
         if args.use_shards:
@@ -130,6 +204,7 @@ def run(args: argparse.Namespace) -> Optional[in_toto.IntotoPayload]:
             hasher,
             merge_hasher_factory(),  # pytype: disable=not-instantiable
             max_workers=args.max_workers,
+            **serializer_kwargs,
         )
     else:
         if args.use_shards:
@@ -137,7 +212,9 @@ def run(args: argparse.Namespace) -> Optional[in_toto.IntotoPayload]:
         else:
             serializer_factory = serialize_by_file.ManifestSerializer
 
-        serializer = serializer_factory(hasher, max_workers=args.max_workers)
+        serializer = serializer_factory(
+            hasher, max_workers=args.max_workers, **serializer_kwargs
+        )
 
     # 3. Signing layer
     if args.single_digest:
@@ -175,12 +252,17 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--hash_method",
         help="hash method to use (default: sha256)",
-        choices=["sha256", "blake2"],
+        choices=["sha256", "sha256_evp", "blake2", "blake3"],
         default="sha256",
     )
     parser.add_argument(
         "--max_workers", help="number of parallel workers to use", type=int
     )
+    parser.add_argument(
+        "--use_processes",
+        help="hash files in separate processes instead of threads",
+        action="store_true",
+    )
 
     param_groups = parser.add_argument_group("Internal parameters to fine-tune")
     param_groups.add_argument(
@@ -195,6 +277,16 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         default=1_000_000_000,
     )
+    param_groups.add_argument(
+        "--use_mmap",
+        help="hash files via a memory-mapped view instead of chunked reads",
+        action="store_true",
+    )
+    param_groups.add_argument(
+        "--use_file_digest",
+        help="hash (unsharded) files via hashlib.file_digest",
+        action="store_true",
+    )
 
     shard_group = parser.add_argument_group("Serialization modes")
     shard_group.add_argument(
@@ -209,7 +301,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--merge_hasher",
         help="hasher to use to merge individual hashes "
         "when skipping manifest creation (default: sha256)",
-        choices=["sha256", "blake2"],
+        choices=["sha256", "sha256_evp", "blake2", "blake3"],
         default="sha256",
     )
 
@@ -38,6 +38,7 @@ class DangerousPublicOIDCBeacon:
 
     def __init__(self):
         self._token = ""
+        self._exp = datetime.min
 
     def _fetch(self) -> None:
         # the git approach is apparently fresher than https://raw.githubusercontent.com
@@ -56,6 +57,7 @@ class DangerousPublicOIDCBeacon:
             token_path = os.path.join(tmpdir, "oidc-token.txt")
             with open(token_path) as f:
                 self._token = f.read().rstrip()
+        self._exp = self._expiration()
 
     def _expiration(self) -> datetime:
         payload = self._token.split(".")[1]
@@ -63,22 +65,39 @@ class DangerousPublicOIDCBeacon:
         payload_json = json.loads(b64decode(payload))
         return datetime.fromtimestamp(payload_json["exp"])
 
+    def token(self) -> str:
+        """Returns a valid token, fetching a fresh one only when needed.
+
+        The beacon tokens are valid for several minutes, so the cached one
+        is reused while it has at least `_MIN_VALIDITY` left, avoiding one
+        clone of the beacon repo per call.
+
+        Raises:
+            TimeoutError: if no valid token was fetched in `_MAX_RETRY_TIME`.
+        """
+        start = datetime.now()
+        while True:
+            now = datetime.now()
+            deadline = now + _MIN_VALIDITY
+            if deadline < self._exp:
+                return self._token
+            if now > start + _MAX_RETRY_TIME:
+                raise TimeoutError("unable to fetch token within time limit")
+            if self._token:
+                time.sleep(_RETRY_SLEEP_SECS)
+            self._fetch()
+
+
+# Module level so that the cached token survives across tests.
+_beacon = DangerousPublicOIDCBeacon()
+
 
 @pytest.fixture
 def sigstore_oidc_beacon_token():
-    beacon = DangerousPublicOIDCBeacon()
-    start = datetime.now()
-    while True:
-        now = datetime.now()
-        deadline = now + _MIN_VALIDITY
-        beacon._fetch()
-        exp = beacon._expiration()
-        if deadline < exp:
-            return beacon._token
-        if now > start + _MAX_RETRY_TIME:
-            break
-        time.sleep(_RETRY_SLEEP_SECS)
-    pytest.fail("unable to fetch token within time limit")
+    try:
+        return _beacon.token()
+    except TimeoutError as e:
+        pytest.fail(str(e))
 
 
 class TestSigstoreSigning:
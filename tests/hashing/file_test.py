@@ -150,6 +150,84 @@ class TestSimpleFileHasher:
         assert hasher.digest_size == memory_hasher.digest_size
 
 
+class TestMmapFileHasher:
+    def test_fails_with_negative_chunk_size(self):
+        with pytest.raises(ValueError, match="Chunk size must be non-negative"):
+            file.MmapFileHasher(_UNUSED_PATH, memory.SHA256(), chunk_size=-2)
+
+    def test_hash_of_known_file(self, sample_file, expected_digest):
+        hasher = file.MmapFileHasher(sample_file, memory.SHA256())
+        digest = hasher.compute()
+        assert digest.digest_hex == expected_digest
+
+    def test_hash_of_empty_file(self, tmp_path):
+        empty_file = tmp_path / "empty"
+        empty_file.write_bytes(b"")
+        hasher = file.MmapFileHasher(empty_file, memory.SHA256())
+        expected = memory.SHA256().compute()
+        digest = hasher.compute()
+        assert digest.digest_hex == expected.digest_hex
+
+    def test_hash_of_large_file_matches_simple_hasher(self, tmp_path):
+        # Use a file above the mmap threshold to exercise the mapped path.
+        large_file = tmp_path / "large"
+        large_file.write_bytes(_FULL_CONTENT.encode("utf-8") * 32768)
+
+        mmap_hasher = file.MmapFileHasher(large_file, memory.SHA256())
+        simple_hasher = file.SimpleFileHasher(large_file, memory.SHA256())
+
+        digest1 = mmap_hasher.compute()
+        digest2 = simple_hasher.compute()
+        assert digest1.digest_hex == digest2.digest_hex
+
+    def test_hash_of_large_file_no_chunk(self, tmp_path):
+        large_file = tmp_path / "large"
+        large_file.write_bytes(_FULL_CONTENT.encode("utf-8") * 32768)
+
+        hasher1 = file.MmapFileHasher(large_file, memory.SHA256())
+        hasher2 = file.MmapFileHasher(large_file, memory.SHA256(), chunk_size=0)
+
+        digest1 = hasher1.compute()
+        digest2 = hasher2.compute()
+        assert digest1.digest_hex == digest2.digest_hex
+
+    def test_hash_of_large_file_small_chunk(self, tmp_path):
+        large_file = tmp_path / "large"
+        large_file.write_bytes(_FULL_CONTENT.encode("utf-8") * 32768)
+
+        hasher1 = file.MmapFileHasher(large_file, memory.SHA256())
+        hasher2 = file.MmapFileHasher(
+            large_file, memory.SHA256(), chunk_size=65537
+        )
+
+        digest1 = hasher1.compute()
+        digest2 = hasher2.compute()
+        assert digest1.digest_hex == digest2.digest_hex
+
+    def test_default_digest_name(self):
+        hasher = file.MmapFileHasher(_UNUSED_PATH, memory.SHA256())
+        assert hasher.digest_name == "file-sha256"
+
+    def test_override_digest_name(self):
+        hasher = file.MmapFileHasher(
+            _UNUSED_PATH,
+            memory.SHA256(),
+            chunk_size=10,
+            digest_name_override="test-hash",
+        )
+        assert hasher.digest_name == "test-hash"
+
+    def test_digest_algorithm_is_digest_name(self, sample_file):
+        hasher = file.MmapFileHasher(sample_file, memory.SHA256())
+        digest = hasher.compute()
+        assert digest.algorithm == hasher.digest_name
+
+    def test_digest_size(self):
+        memory_hasher = memory.SHA256()
+        hasher = file.MmapFileHasher(sample_file, memory_hasher)
+        assert hasher.digest_size == memory_hasher.digest_size
+
+
 class TestShardedFileHasher:
     def test_fails_with_negative_shard_size(self):
         with pytest.raises(
@@ -413,6 +491,101 @@ class TestShardedFileHasher:
         assert hasher.digest_size == memory_hasher.digest_size
 
 
+class TestFileDigestHasher:
+    def test_hash_of_known_file(self, sample_file, expected_digest):
+        hasher = file.FileDigestHasher(sample_file)
+        digest = hasher.compute()
+        assert digest.digest_hex == expected_digest
+
+    def test_set_file(self, sample_file, sample_file_content_only):
+        hasher = file.FileDigestHasher(sample_file)
+        digest1 = hasher.compute()
+        hasher.set_file(sample_file_content_only)
+        _ = hasher.compute()
+        hasher.set_file(sample_file)
+        digest2 = hasher.compute()
+        assert digest1.digest_value == digest2.digest_value
+
+    def test_default_digest_name(self):
+        hasher = file.FileDigestHasher(_UNUSED_PATH)
+        assert hasher.digest_name == "file-sha256"
+
+    def test_override_digest_name(self):
+        hasher = file.FileDigestHasher(
+            _UNUSED_PATH, digest_name_override="test-hash"
+        )
+        assert hasher.digest_name == "test-hash"
+
+    def test_digest_algorithm_is_digest_name(self, sample_file):
+        hasher = file.FileDigestHasher(sample_file)
+        digest = hasher.compute()
+        assert digest.algorithm == hasher.digest_name
+
+    def test_digest_size(self):
+        hasher = file.FileDigestHasher(_UNUSED_PATH)
+        memory_hasher = memory.SHA256()
+        assert hasher.digest_size == memory_hasher.digest_size
+
+
+class TestMmapShardedFileHasher:
+    def test_hash_of_known_file(
+        self, sample_file, expected_header_digest, expected_content_digest
+    ):
+        hasher1 = file.MmapShardedFileHasher(
+            sample_file, memory.SHA256(), start=0, end=_SHARD_SIZE
+        )
+        hasher2 = file.MmapShardedFileHasher(
+            sample_file, memory.SHA256(), start=_SHARD_SIZE, end=2 * _SHARD_SIZE
+        )
+
+        digest1 = hasher1.compute()
+        assert digest1.digest_hex == expected_header_digest
+
+        digest2 = hasher2.compute()
+        assert digest2.digest_hex == expected_content_digest
+
+    def test_hash_of_known_file_end_overflow(
+        self, sample_file, expected_digest
+    ):
+        hasher = file.MmapShardedFileHasher(
+            sample_file, memory.SHA256(), start=0, end=3 * _SHARD_SIZE
+        )
+        digest = hasher.compute()
+        assert digest.digest_hex == expected_digest
+
+    def test_hash_of_large_shard_matches_read_hasher(self, tmp_path):
+        # Use a shard above the mmap threshold to exercise the mapped path.
+        large_file = tmp_path / "large"
+        content = _FULL_CONTENT.encode("utf-8") * 32768
+        large_file.write_bytes(content)
+        shard_size = len(content)
+
+        hasher1 = file.MmapShardedFileHasher(
+            large_file,
+            memory.SHA256(),
+            start=0,
+            end=shard_size,
+            shard_size=shard_size,
+        )
+        hasher2 = file.ShardedFileHasher(
+            large_file,
+            memory.SHA256(),
+            start=0,
+            end=shard_size,
+            shard_size=shard_size,
+        )
+
+        digest1 = hasher1.compute()
+        digest2 = hasher2.compute()
+        assert digest1.digest_hex == digest2.digest_hex
+
+    def test_default_digest_name(self):
+        hasher = file.MmapShardedFileHasher(
+            _UNUSED_PATH, memory.SHA256(), start=0, end=2, shard_size=10
+        )
+        assert hasher.digest_name == "file-sha256-10"
+
+
 class TestOpenedFileHasher:
     def test_hash_of_known_file(self, sample_file, expected_digest):
         with open(sample_file, "rb") as f:
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 from model_signing.hashing import memory
 
 
@@ -70,6 +72,120 @@ class TestSHA256:
         assert digest.digest_size == 32
 
 
+class TestBLAKE3:
+    # The `blake3` package is an optional dependency of the benchmarks.
+    @pytest.fixture(autouse=True)
+    def _requires_blake3(self):
+        pytest.importorskip("blake3")
+
+    def test_hash_known_value(self):
+        hasher = memory.BLAKE3(b"Test string")
+        digest = hasher.compute()
+        expected = (
+            "f3adfd721502f7d9510368688a392ab4f29dbff47092c0aea25f638d4985a8b1"
+        )
+        assert digest.digest_hex == expected
+
+    def test_hash_update_twice_is_the_same_as_update_with_concatenation(self):
+        str1 = "Test "
+        str2 = "string"
+
+        hasher1 = memory.BLAKE3()
+        hasher1.update(str1.encode("utf-8"))
+        hasher1.update(str2.encode("utf-8"))
+        digest1 = hasher1.compute()
+
+        str_all = str1 + str2
+        hasher2 = memory.BLAKE3()
+        hasher2.update(str_all.encode("utf-8"))
+        digest2 = hasher2.compute()
+
+        assert digest1.digest_hex == digest2.digest_hex
+        assert digest1.digest_value == digest2.digest_value
+
+    def test_update_after_reset(self):
+        hasher = memory.BLAKE3(b"Test string")
+        digest1 = hasher.compute()
+        hasher.reset()
+        hasher.update(b"Test string")
+        digest2 = hasher.compute()
+
+        assert digest1.digest_hex == digest2.digest_hex
+        assert digest1.digest_value == digest2.digest_value
+
+    def test_digest_size(self):
+        hasher = memory.BLAKE3(b"Test string")
+        assert hasher.digest_size == 32
+
+        digest = hasher.compute()
+        assert digest.digest_size == 32
+
+
+class TestSHA256EVP:
+    def test_hash_known_value(self):
+        hasher = memory.SHA256EVP(b"Test string")
+        digest = hasher.compute()
+        expected = (
+            "a3e49d843df13c2e2a7786f6ecd7e0d184f45d718d1ac1a8a63e570466e489dd"
+        )
+        assert digest.digest_hex == expected
+
+    def test_hash_matches_sha256_engine(self):
+        hasher1 = memory.SHA256EVP(b"Test string")
+        hasher2 = memory.SHA256(b"Test string")
+
+        digest1 = hasher1.compute()
+        digest2 = hasher2.compute()
+
+        assert digest1.algorithm == digest2.algorithm
+        assert digest1.digest_hex == digest2.digest_hex
+
+    def test_hash_update_twice_is_the_same_as_update_with_concatenation(self):
+        str1 = "Test "
+        str2 = "string"
+
+        hasher1 = memory.SHA256EVP()
+        hasher1.update(str1.encode("utf-8"))
+        hasher1.update(str2.encode("utf-8"))
+        digest1 = hasher1.compute()
+
+        str_all = str1 + str2
+        hasher2 = memory.SHA256EVP()
+        hasher2.update(str_all.encode("utf-8"))
+        digest2 = hasher2.compute()
+
+        assert digest1.digest_hex == digest2.digest_hex
+        assert digest1.digest_value == digest2.digest_value
+
+    def test_update_after_reset(self):
+        hasher = memory.SHA256EVP(b"Test string")
+        digest1 = hasher.compute()
+        hasher.reset()
+        hasher.update(b"Test string")
+        digest2 = hasher.compute()
+
+        assert digest1.digest_hex == digest2.digest_hex
+        assert digest1.digest_value == digest2.digest_value
+
+    def test_update_after_compute(self):
+        hasher = memory.SHA256EVP(b"Test ")
+        _ = hasher.compute()
+        hasher.update(b"string")
+        digest1 = hasher.compute()
+
+        hasher2 = memory.SHA256EVP(b"Test string")
+        digest2 = hasher2.compute()
+
+        assert digest1.digest_hex == digest2.digest_hex
+
+    def test_digest_size(self):
+        hasher = memory.SHA256EVP(b"Test string")
+        assert hasher.digest_size == 32
+
+        digest = hasher.compute()
+        assert digest.digest_size == 32
+
+
 class TestBLAKE2:
     def test_hash_known_value(self):
         hasher = memory.BLAKE2(b"Test string")
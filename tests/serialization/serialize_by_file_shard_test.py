@@ -100,6 +100,26 @@ class TestDigestSerializer:
 
             assert manifest.digest.digest_hex == expected_digest
 
+    def test_prefix_colliding_names_keep_path_order(self, tmp_path):
+        # "config/part" sorts before "config.json" when comparing paths
+        # component by component, but after it when comparing the joined path
+        # strings. The digest locks in the component order, which previously
+        # signed models rely on.
+        model = tmp_path / "model"
+        (model / "config").mkdir(parents=True)
+        (model / "config.json").write_bytes(b"json data")
+        (model / "config" / "part").write_bytes(b"part data")
+
+        serializer = serialize_by_file_shard.DigestSerializer(
+            self._hasher_factory, memory.SHA256()
+        )
+        manifest = serializer.serialize(model)
+
+        expected = (
+            "fb9bc71fdbb3c0b67b67534d3894d4cb174f19c9dbdabf748bc562995d047ae9"
+        )
+        assert manifest.digest.digest_hex == expected
+
     def test_file_hash_is_not_same_as_hash_of_content(self, sample_model_file):
         serializer = serialize_by_file_shard.DigestSerializer(
             self._hasher_factory, memory.SHA256()
@@ -321,6 +341,16 @@ class TestDigestSerializer:
         )
         assert manifest1 != manifest2
 
+    def test_ignore_list_respects_root_file(self, sample_model_file):
+        serializer = serialize_by_file_shard.DigestSerializer(
+            self._hasher_factory, memory.SHA256()
+        )
+        manifest = serializer.serialize(
+            sample_model_file, ignore_paths=[sample_model_file]
+        )
+        empty_digest = memory.SHA256().compute()
+        assert manifest.digest.digest_hex == empty_digest.digest_hex
+
 
 def _extract_shard_items_from_manifest(
     manifest: manifest.ShardLevelManifest,
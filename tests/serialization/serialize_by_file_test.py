@@ -62,6 +62,26 @@ class TestDigestSerializer:
 
             assert manifest.digest.digest_hex == expected_digest
 
+    def test_prefix_colliding_names_keep_path_order(self, tmp_path):
+        # "config/part" sorts before "config.json" when comparing paths
+        # component by component, but after it when comparing the joined path
+        # strings. The digest locks in the component order, which previously
+        # signed models rely on.
+        model = tmp_path / "model"
+        (model / "config").mkdir(parents=True)
+        (model / "config.json").write_bytes(b"json data")
+        (model / "config" / "part").write_bytes(b"part data")
+
+        serializer = serialize_by_file.DigestSerializer(
+            self._hasher_factory, memory.SHA256()
+        )
+        manifest = serializer.serialize(model)
+
+        expected = (
+            "847eb0e1d84e93856bde30108703d5563f00ef35a59ee44e23dbfddedd376bdb"
+        )
+        assert manifest.digest.digest_hex == expected
+
     def test_file_hash_is_same_as_hash_of_content(self, sample_model_file):
         serializer = serialize_by_file.DigestSerializer(
             self._hasher_factory, memory.SHA256()
@@ -256,6 +276,16 @@ class TestDigestSerializer:
         )
         assert manifest1 != manifest2
 
+    def test_ignore_list_respects_root_file(self, sample_model_file):
+        serializer = serialize_by_file.DigestSerializer(
+            self._hasher_factory, memory.SHA256()
+        )
+        manifest = serializer.serialize(
+            sample_model_file, ignore_paths=[sample_model_file]
+        )
+        empty_digest = memory.SHA256().compute()
+        assert manifest.digest.digest_hex == empty_digest.digest_hex
+
 
 class TestManifestSerializer:
     def _hasher_factory(self, path: pathlib.Path) -> file.FileHasher:
@@ -518,6 +548,17 @@ class TestManifestSerializer:
         assert manifest1 == manifest2
         assert manifest1 == manifest3
 
+    def test_use_processes_does_not_change_digest(self, sample_model_folder):
+        serializer1 = serialize_by_file.ManifestSerializer(self._hasher_factory)
+        serializer2 = serialize_by_file.ManifestSerializer(
+            self._hasher_factory, max_workers=2, use_processes=True
+        )
+
+        manifest1 = serializer1.serialize(sample_model_folder)
+        manifest2 = serializer2.serialize(sample_model_folder)
+
+        assert manifest1 == manifest2
+
     def test_symlinks_disallowed_by_default(self, symlink_model_folder):
         serializer = serialize_by_file.ManifestSerializer(self._hasher_factory)
         with pytest.raises(